@@ -0,0 +1,76 @@
+"""Client-side quota machinery for outbound LLM calls.
+
+Transcription is still served by mock content, but the worker pool already
+runs jobs as if a provider were behind it. This module holds the rate
+limiting and retry plumbing so going live only means swapping the content
+lookup for a real call wrapped in `llm_retry` behind `RateLimiter.acquire`.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+
+
+class RateLimitError(Exception):
+    """Provider answered 429; carries the suggested wait when given"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RateLimiter:
+    """Token bucket tracking a requests-per-minute provider quota.
+
+    Callers `await acquire()` before each request; when the bucket is empty
+    they sleep until a token refills instead of eating a 429. When response
+    headers arrive, `update_remaining` re-syncs the local view with the
+    provider's real budget.
+    """
+
+    def __init__(self, requests_per_minute: int = 50):
+        self._capacity = float(requests_per_minute)
+        self._refill_rate = requests_per_minute / 60.0
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._refill_rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Take one request token, sleeping until one is available"""
+        while True:
+            async with self._lock:
+                self._refill()
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self._refill_rate
+            await asyncio.sleep(wait)
+
+    def update_remaining(self, remaining: int):
+        """Clamp the bucket to the x-ratelimit-remaining-requests header"""
+        self._tokens = min(self._tokens, float(remaining))
+
+
+def _wait_rate_limited(retry_state):
+    """Honor the provider's retry-after when present, else back off with jitter"""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, RateLimitError) and exc.retry_after is not None:
+        return exc.retry_after
+    return wait_exponential_jitter(initial=1, max=30)(retry_state)
+
+
+# Decorator for the eventual provider call: retries only quota errors, up to
+# six attempts, then surfaces the original exception to the worker
+llm_retry = retry(
+    wait=_wait_rate_limited,
+    stop=stop_after_attempt(6),
+    retry=retry_if_exception_type(RateLimitError),
+    reraise=True,
+)
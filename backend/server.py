@@ -1,68 +1,172 @@
-from fastapi import FastAPI, APIRouter, HTTPException, File, UploadFile, Depends, Header
+from fastapi import FastAPI, APIRouter, HTTPException, File, Form, UploadFile, Depends, Header, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient, ReturnDocument
+from gridfs import AsyncGridFSBucket
+from gridfs.errors import NoFile
+from bson import Binary, ObjectId
 import os
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import List, Literal, Optional
 import uuid
-from datetime import datetime, timedelta
-import base64
+import uuid6
+from datetime import datetime, timedelta, timezone
+import binascii
+import pybase64 as base64  # SIMD-accelerated drop-in for stdlib base64
+import time
 import asyncio
+import hashlib
 import json
+import httpx
+import orjson
+import uvloop
+import zstandard
+from cachetools import TTLCache
+from jose import jwt, JWTError
 from emergentintegrations.llm.chat import LlmChat, UserMessage
+from llm_client import RateLimiter
+from mock_content import LANGUAGE_CONTENT as _LANGUAGE_CONTENT
+
+# Use the libuv-backed event loop for all async I/O (Mongo, LLM calls)
+uvloop.install()
+
+def utcnow() -> datetime:
+    """Naive UTC now; utcnow() is deprecated and slower in 3.12+"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncMongoClient(
+    mongo_url,
+    maxPoolSize=200,
+    minPoolSize=20,
+    maxIdleTimeMS=60000,
+    waitQueueTimeoutMS=2500,
+    serverSelectionTimeoutMS=3000,
+    # Wire compression; negotiated down gracefully if the server lacks zstd.
+    # snappy is left out on purpose: python-snappy is not a dependency
+    compressors="zstd,zlib"
+)
 db = client[os.environ['DB_NAME']]
 
+# Raw audio lives in GridFS; recording documents only hold a reference
+audio_bucket = AsyncGridFSBucket(db, bucket_name="audio")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup/shutdown in one place instead of scattered on_event hooks"""
+    await create_db_indexes()
+    await start_processing_workers()
+    await create_http_client()
+    yield
+    await stop_processing_workers()
+    await close_http_client()
+    await shutdown_db_client()
+
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
+# Per-user read endpoints that are safe to cache briefly client-side
+_CACHEABLE_GET_PATHS = frozenset({"/api/user/profile", "/api/user/referral", "/api/user/me"})
+
+@app.middleware("http")
+async def cache_headers(request: Request, call_next):
+    """Stamp short private caching on the per-user read endpoints"""
+    response = await call_next(request)
+    if request.method == "GET" and request.url.path in _CACHEABLE_GET_PATHS and response.status_code == 200:
+        response.headers["Cache-Control"] = "private, max-age=30, stale-while-revalidate=60"
+    return response
+
 # Security
 security = HTTPBearer()
 
+# Short-TTL cache of session token -> (User, expiry unix timestamp) so repeat
+# requests from the same client skip the per-request Mongo round-trips; plain
+# float comparison keeps the hot path free of datetime construction
+_session_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+# User documents cached by user id so hot profile reads skip Mongo entirely;
+# writers must call _invalidate_user_caches after updating a user
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+# Referral data split by volatility: the code is assigned once and never
+# changes, the discount moves whenever a referral lands
+_referral_code_cache: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_discount_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+def _invalidate_user_caches(user_id: str):
+    """Drop all cached views of a user after a profile write"""
+    _user_cache.pop(user_id, None)
+    _discount_cache.pop(user_id, None)
+    for token, (user, _) in list(_session_cache.items()):
+        if user.id == user_id:
+            _session_cache.pop(token, None)
+
+# Signed access tokens: expiry and identity are verified by crypto alone, so
+# authenticating a request never needs the sessions collection
+JWT_SECRET = os.environ.get('JWT_SECRET', 'change-me-in-production')
+JWT_ALGORITHM = "HS256"
+JWT_TTL_MINUTES = 15
+
 # Models
 class User(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    # Time-ordered UUIDv7 ids keep B-tree inserts append-only instead of
+    # scattering across the index like random v4 ids
+    id: str = Field(default_factory=lambda: str(uuid6.uuid7()))
     email: str
     name: str
     picture: Optional[str] = None
     subscription_status: str = "trial"
     referral_code: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
     discount_amount: float = 0.0
+    monthly_cost: float = 2.0  # Denormalized; writers of discount_amount must keep it in sync
     preferred_language: str = "en"  # Default to English
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    version: int = 0  # Bumped on every profile write; drives the ETag
+    created_at: datetime = Field(default_factory=utcnow)
 
 class Recording(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: str(uuid6.uuid7()))
     user_id: str
     title: str
-    audio_data: str  # Base64 encoded audio
+    audio_ref: Optional[str] = None  # GridFS file id for the raw audio
+    audio_sha256: Optional[str] = None  # Content hash, computed during upload
     transcript: Optional[str] = None
     summary: Optional[str] = None
     tags: List[str] = []
     notes: str = ""
     duration: Optional[float] = None
     status: str = "uploaded"  # uploaded, processing, completed, failed
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+
+class RecordingSummary(BaseModel):
+    # Shape of the list-view documents; get_recordings derives its Mongo
+    # projection from these fields, so no audio/transcript data can leak
+    id: str
+    user_id: str
+    title: str
+    tags: List[str] = []
+    notes: str = ""
+    duration: Optional[float] = None
+    status: str = "uploaded"
+    created_at: datetime
 
 class Session(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: str(uuid6.uuid7()))
     user_id: str
     session_token: str
     expires_at: datetime
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
 
 class RecordingCreate(BaseModel):
     title: str
@@ -74,396 +178,206 @@ class RecordingCreate(BaseModel):
 class TranscriptionRequest(BaseModel):
     recording_id: str
     type: str = "full"  # full, summary, chapters
-    language: str = "en"  # User's preferred language
+    language: Literal["en", "it", "es", "fr", "de"] = "en"  # User's preferred language
+
+class LanguageUpdate(BaseModel):
+    language: Literal["en", "it", "es", "fr", "de"] = "en"
 
 class ProcessingResponse(BaseModel):
     message: str
     recording_id: str
     status: str
 
+# LLM configuration (used once real transcription replaces the mock content)
+LLM_SYSTEM_MESSAGE = "You are an AI assistant that helps students transcribe, summarize and structure lecture recordings."
+
+# Static system block marked for Anthropic prompt caching: repeat calls reuse
+# the cached preamble and only pay full input price for the dynamic prompt
+LLM_SYSTEM_BLOCKS = [
+    {"type": "text", "text": LLM_SYSTEM_MESSAGE, "cache_control": {"type": "ephemeral"}}
+]
+LLM_EXTRA_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+# Per-mode prompt templates, hoisted so calls reuse the same strings instead
+# of rebuilding them per invocation (also keeps them byte-identical, which is
+# what makes provider-side prompt caching hit)
+LLM_PROMPTS = {
+    "full": "Transcribe this lecture recording in {language}, preserving the speaker's structure and examples.",
+    "summary": "Summarize this lecture recording in {language}: key concepts, main points, practical examples and study focus.",
+    "chapters": "Split this lecture recording into titled chapters with timestamps, in {language}."
+}
+
+def build_llm_chat(session_id: str) -> LlmChat:
+    """Build an LlmChat for a processing run with the cacheable system message"""
+    return LlmChat(
+        api_key=os.environ.get('ANTHROPIC_API_KEY'),
+        session_id=session_id,
+        system_message=LLM_SYSTEM_MESSAGE
+    ).with_model("anthropic", "claude-3-5-sonnet-20241022")
+
 # Helper functions
+def issue_access_token(user: User) -> str:
+    """Issue a short-lived signed JWT carrying the user identity"""
+    claims = {
+        "sub": user.id,
+        "lang": user.preferred_language,
+        "exp": utcnow() + timedelta(minutes=JWT_TTL_MINUTES)
+    }
+    return jwt.encode(claims, JWT_SECRET, algorithm=JWT_ALGORITHM)
+
+# Only the fields the User model carries: skips _id and any stray legacy keys
+# so auth lookups move the minimum over the wire
+_USER_PROJECTION = {name: 1 for name in User.model_fields}
+_USER_PROJECTION["_id"] = 0
+
+async def _load_user(user_id: str) -> Optional[User]:
+    """Fetch a user by id through the in-process cache"""
+    user_obj = _user_cache.get(user_id)
+    if user_obj is None:
+        doc = await db.users.find_one({"id": user_id}, _USER_PROJECTION)
+        if not doc:
+            return None
+        user_obj = User.model_validate(doc)
+        _user_cache[user_id] = user_obj
+    return user_obj
+
 async def get_current_user(authorization: HTTPAuthorizationCredentials = Depends(security)):
     token = authorization.credentials
-    session = await db.sessions.find_one({"session_token": token})
-    if not session:
+
+    cached = _session_cache.get(token)
+    if cached:
+        user, expires_ts = cached
+        if expires_ts >= time.time():
+            return user
+        _session_cache.pop(token, None)
+
+    # Fast path: a valid JWT proves identity and expiry without touching the
+    # sessions collection, so only the user document is loaded on cache miss
+    try:
+        claims = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+    except JWTError:
+        claims = None
+
+    if claims is not None:
+        user_obj = await _load_user(claims["sub"])
+        if user_obj is None:
+            raise HTTPException(status_code=401, detail="User not found")
+        # The JWT exp claim is already a unix timestamp; store it as-is
+        _session_cache[token] = (user_obj, claims["exp"])
+        return user_obj
+
+    # Legacy opaque session tokens: resolve session and user in a single round-trip
+    cursor = await db.sessions.aggregate([
+        {"$match": {"session_token": token}},
+        {"$limit": 1},
+        {"$lookup": {"from": "users", "localField": "user_id", "foreignField": "id", "as": "user"}},
+        {"$unwind": "$user"}
+    ])
+    docs = await cursor.to_list(1)
+    if not docs:
         raise HTTPException(status_code=401, detail="Invalid session token")
-    
-    session_obj = Session(**session)
-    if session_obj.expires_at < datetime.utcnow():
+
+    session = docs[0]
+    if session["expires_at"] < utcnow():
         raise HTTPException(status_code=401, detail="Session expired")
-    
-    user = await db.users.find_one({"id": session_obj.user_id})
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
-    
-    return User(**user)
 
-async def process_audio_with_ai(recording_id: str, audio_data: str, processing_type: str = "full", language: str = "en"):
+    user_obj = User.model_validate(session["user"])
+    # BSON datetimes are naive UTC; pin the zone before taking the timestamp
+    _session_cache[token] = (user_obj, session["expires_at"].replace(tzinfo=timezone.utc).timestamp())
+    return user_obj
+
+# Supported languages as a fixed table: content is resolved by ordinal index
+# instead of a dict lookup with a miss branch
+SUPPORTED_LANGUAGES = ("en", "it", "es", "fr", "de")
+_LANG_IDX = {lang: i for i, lang in enumerate(SUPPORTED_LANGUAGES)}
+_CONTENT_BY_LANG = tuple(_LANGUAGE_CONTENT[lang] for lang in SUPPORTED_LANGUAGES)
+
+# Responses for the language endpoint never vary per user, so build them once
+_LANG_RESPONSES = {
+    lang: {"message": f"Language updated to {lang}", "language": lang}
+    for lang in SUPPORTED_LANGUAGES
+}
+
+# Which recording field each processing type writes to
+_FIELD_BY_TYPE = {"full": "transcript", "summary": "summary", "chapters": "summary"}
+
+# Large transcript/summary text is zstd-compressed at the storage layer;
+# reads transparently decompress, and legacy plain-string values pass through
+_zstd_compressor = zstandard.ZstdCompressor(level=3)
+_zstd_decompressor = zstandard.ZstdDecompressor()
+
+def _compress_text(text: str) -> Binary:
+    return Binary(_zstd_compressor.compress(text.encode("utf-8")))
+
+def _decompress_text(value):
+    if isinstance(value, bytes):
+        return _zstd_decompressor.decompress(value).decode("utf-8")
+    return value
+
+# In-flight processing jobs keyed by (recording_id, type, language);
+# duplicate requests coalesce onto the existing job instead of spawning
+# another LLM call, while the same job in a new language still runs
+_inflight_processing: dict = {}
+
+# Bounded queue + worker pool: a burst of process requests queues up instead
+# of fanning out into unbounded concurrent LLM calls
+PROCESSING_WORKER_COUNT = 8
+_processing_queue: asyncio.Queue = asyncio.Queue()
+_llm_semaphore = asyncio.Semaphore(8)
+# Provider request quota, consumed only on cache misses that would hit the API
+_llm_rate_limiter = RateLimiter(requests_per_minute=int(os.environ.get('LLM_RPM', '50')))
+_worker_tasks: List[asyncio.Task] = []
+
+async def _processing_worker():
+    """Drain queued processing jobs under the LLM concurrency limit"""
+    while True:
+        recording_id, processing_type, language, audio_sha256 = await _processing_queue.get()
+        try:
+            async with _llm_semaphore:
+                await process_audio_with_ai(recording_id, processing_type, language, audio_sha256)
+        finally:
+            _inflight_processing.pop((recording_id, processing_type, language), None)
+            _processing_queue.task_done()
+
+async def process_audio_with_ai(recording_id: str, processing_type: str = "full", language: str = "en",
+                                audio_sha256: Optional[str] = None):
     """Process audio data with language-specific mock AI responses"""
     try:
-        # Language-specific content templates
-        language_content = {
-            "en": {
-                "full": """Welcome to today's Physics lecture on Newton's Laws of Motion. 
-
-Today we're going to explore the fundamental principles that govern how objects move and interact with forces. Let's start with Newton's First Law, also known as the Law of Inertia.
-
-Newton's First Law states that an object at rest stays at rest, and an object in motion stays in motion at constant velocity, unless acted upon by an external force. This might seem obvious, but it's actually quite profound when you think about it.
-
-For example, if you're sitting in a car and the car suddenly stops, your body continues moving forward. This is because your body wants to maintain its state of motion - that's inertia in action.
-
-Now, let's move on to Newton's Second Law, which is probably the most famous: F equals ma. Force equals mass times acceleration. This law tells us that the force applied to an object is directly proportional to the mass of the object and its acceleration.
-
-A practical example: if you push a shopping cart with the same force, an empty cart will accelerate much faster than a full cart. Same force, different mass, different acceleration.
-
-Finally, Newton's Third Law states that for every action, there is an equal and opposite reaction. When you walk, you push backward on the ground, and the ground pushes forward on you.
-
-These three laws form the foundation of classical mechanics and help us understand motion in our everyday world. Next class, we'll explore how these laws apply to circular motion and gravity.""",
-                "summary": """📚 **Physics Lecture Summary: Newton's Laws of Motion**
-
-**🎯 Key Concepts:**
-• **Newton's First Law (Law of Inertia)**: Objects maintain their state of motion unless acted upon by external forces
-• **Newton's Second Law**: F = ma (Force = mass × acceleration)  
-• **Newton's Third Law**: Every action has an equal and opposite reaction
-
-**💡 Main Points:**
-1. **Inertia explained**: Objects resist changes in motion - demonstrated by car stopping example
-2. **Force-mass relationship**: Same force on different masses produces different accelerations (shopping cart example)
-3. **Action-reaction pairs**: Walking involves pushing ground backward, ground pushes you forward
-
-**🔍 Practical Examples:**
-- Car stopping → body continues moving forward (inertia)
-- Empty vs full shopping cart → different accelerations with same force
-- Walking → action-reaction force pairs
-
-**📖 Next Session Preview:**
-Application of these laws to circular motion and gravitational forces
-
-**⭐ Study Focus:**
-Understand how these three fundamental laws explain everyday motion phenomena""",
-                "chapters": """📖 **Lecture Structure: Newton's Laws of Motion**
-
-**🎬 Introduction (0:00-2:30)**
-- Course overview and today's topic
-- Importance of Newton's Laws in physics
-
-**📚 Chapter 1: Newton's First Law - Law of Inertia (2:30-8:45)**
-- Definition and explanation
-- Real-world examples (car stopping scenario)
-- Understanding inertia in daily life
-
-**⚖️ Chapter 2: Newton's Second Law - F=ma (8:45-15:20)**
-- Mathematical relationship between force, mass, and acceleration
-- Practical demonstration: shopping cart example
-- Problem-solving applications
-
-**🔄 Chapter 3: Newton's Third Law - Action-Reaction (15:20-22:10)**
-- Equal and opposite reactions principle
-- Walking as an example of action-reaction pairs
-- Common misconceptions addressed
-
-**🎯 Conclusion & Next Steps (22:10-25:00)**
-- Summary of three laws
-- Preview of next lecture: circular motion and gravity
-- Study recommendations
-
-**💡 Key Takeaways:**
-Each law builds upon the previous one to create a complete understanding of motion dynamics"""
-            },
-            "it": {
-                "full": """Benvenuti alla lezione di Fisica di oggi sulle Leggi del Moto di Newton.
-
-Oggi esploreremo i principi fondamentali che governano come gli oggetti si muovono e interagiscono con le forze. Iniziamo con la Prima Legge di Newton, nota anche come Legge dell'Inerzia.
-
-La Prima Legge di Newton afferma che un oggetto a riposo rimane a riposo, e un oggetto in movimento rimane in movimento a velocità costante, a meno che non sia soggetto a una forza esterna. Questo può sembrare ovvio, ma è in realtà molto profondo.
-
-Ad esempio, se state seduti in una macchina e la macchina si ferma improvvisamente, il vostro corpo continua a muoversi in avanti. Questo perché il vostro corpo vuole mantenere il suo stato di moto - questa è l'inerzia in azione.
-
-Ora, passiamo alla Seconda Legge di Newton, che è probabilmente la più famosa: F uguale ma. Forza uguale massa per accelerazione. Questa legge ci dice che la forza applicata a un oggetto è direttamente proporzionale alla massa dell'oggetto e alla sua accelerazione.
-
-Un esempio pratico: se spingete un carrello della spesa con la stessa forza, un carrello vuoto accelererà molto più velocemente di un carrello pieno. Stessa forza, massa diversa, accelerazione diversa.
-
-Infine, la Terza Legge di Newton afferma che per ogni azione, c'è una reazione uguale e opposta. Quando camminate, spingete all'indietro sul terreno, e il terreno spinge in avanti su di voi.
-
-Queste tre leggi formano la base della meccanica classica e ci aiutano a comprendere il movimento nel nostro mondo quotidiano. La prossima lezione esploreremo come queste leggi si applicano al moto circolare e alla gravità.""",
-                "summary": """📚 **Riassunto Lezione di Fisica: Leggi del Moto di Newton**
-
-**🎯 Concetti Chiave:**
-• **Prima Legge di Newton (Legge dell'Inerzia)**: Gli oggetti mantengono il loro stato di moto a meno che non siano soggetti a forze esterne
-• **Seconda Legge di Newton**: F = ma (Forza = massa × accelerazione)
-• **Terza Legge di Newton**: Ogni azione ha una reazione uguale e opposta
-
-**💡 Punti Principali:**
-1. **Inerzia spiegata**: Gli oggetti resistono ai cambiamenti nel moto - dimostrato dall'esempio dell'auto che si ferma
-2. **Relazione forza-massa**: Stessa forza su masse diverse produce accelerazioni diverse (esempio carrello della spesa)
-3. **Coppie azione-reazione**: Camminare implica spingere il terreno all'indietro, il terreno spinge in avanti
-
-**🔍 Esempi Pratici:**
-- Auto che si ferma → corpo continua a muoversi in avanti (inerzia)
-- Carrello vuoto vs pieno → accelerazioni diverse con stessa forza
-- Camminare → coppie di forze azione-reazione
-
-**📖 Anteprima Prossima Sessione:**
-Applicazione di queste leggi al moto circolare e alle forze gravitazionali
-
-**⭐ Focus di Studio:**
-Comprendere come queste tre leggi fondamentali spiegano i fenomeni di moto quotidiani""",
-                "chapters": """📖 **Struttura della Lezione: Leggi del Moto di Newton**
-
-**🎬 Introduzione (0:00-2:30)**
-- Panoramica del corso e argomento di oggi
-- Importanza delle Leggi di Newton nella fisica
-
-**📚 Capitolo 1: Prima Legge di Newton - Legge dell'Inerzia (2:30-8:45)**
-- Definizione e spiegazione
-- Esempi del mondo reale (scenario auto che si ferma)
-- Comprensione dell'inerzia nella vita quotidiana
-
-**⚖️ Capitolo 2: Seconda Legge di Newton - F=ma (8:45-15:20)**
-- Relazione matematica tra forza, massa e accelerazione
-- Dimostrazione pratica: esempio del carrello della spesa
-- Applicazioni nella risoluzione di problemi
-
-**🔄 Capitolo 3: Terza Legge di Newton - Azione-Reazione (15:20-22:10)**
-- Principio delle reazioni uguali e opposte
-- Camminare come esempio di coppie azione-reazione
-- Errori comuni affrontati
-
-**🎯 Conclusione e Prossimi Passi (22:10-25:00)**
-- Riassunto delle tre leggi
-- Anteprima della prossima lezione: moto circolare e gravità
-- Raccomandazioni di studio
-
-**💡 Punti Chiave:**
-Ogni legge si basa sulla precedente per creare una comprensione completa delle dinamiche del moto"""
-            },
-            "es": {
-                "full": """Bienvenidos a la clase de Física de hoy sobre las Leyes del Movimiento de Newton.
-
-Hoy vamos a explorar los principios fundamentales que gobiernan cómo los objetos se mueven e interactúan con las fuerzas. Empecemos con la Primera Ley de Newton, también conocida como la Ley de Inercia.
-
-La Primera Ley de Newton establece que un objeto en reposo permanece en reposo, y un objeto en movimiento permanece en movimiento a velocidad constante, a menos que sea afectado por una fuerza externa. Esto puede parecer obvio, pero es realmente muy profundo cuando lo piensas.
-
-Por ejemplo, si estás sentado en un carro y el carro se detiene repentinamente, tu cuerpo continúa moviéndose hacia adelante. Esto es porque tu cuerpo quiere mantener su estado de movimiento - eso es la inercia en acción.
-
-Ahora, pasemos a la Segunda Ley de Newton, que es probablemente la más famosa: F igual ma. Fuerza igual masa por aceleración. Esta ley nos dice que la fuerza aplicada a un objeto es directamente proporcional a la masa del objeto y su aceleración.
-
-Un ejemplo práctico: si empujas un carrito de compras con la misma fuerza, un carrito vacío acelerará mucho más rápido que un carrito lleno. Misma fuerza, diferente masa, diferente aceleración.
-
-Finalmente, la Tercera Ley de Newton establece que para cada acción, hay una reacción igual y opuesta. Cuando caminas, empujas hacia atrás en el suelo, y el suelo empuja hacia adelante en ti.
-
-Estas tres leyes forman la base de la mecánica clásica y nos ayudan a entender el movimiento en nuestro mundo cotidiano. La próxima clase exploraremos cómo estas leyes se aplican al movimiento circular y la gravedad.""",
-                "summary": """📚 **Resumen de Clase de Física: Leyes del Movimiento de Newton**
-
-**🎯 Conceptos Clave:**
-• **Primera Ley de Newton (Ley de Inercia)**: Los objetos mantienen su estado de movimiento a menos que sean afectados por fuerzas externas
-• **Segunda Ley de Newton**: F = ma (Fuerza = masa × aceleración)
-• **Tercera Ley de Newton**: Cada acción tiene una reacción igual y opuesta
-
-**💡 Puntos Principales:**
-1. **Inercia explicada**: Los objetos resisten cambios en el movimiento - demostrado por el ejemplo del carro que se detiene
-2. **Relación fuerza-masa**: Misma fuerza en diferentes masas produce diferentes aceleraciones (ejemplo del carrito de compras)
-3. **Pares acción-reacción**: Caminar involucra empujar el suelo hacia atrás, el suelo empuja hacia adelante
-
-**🔍 Ejemplos Prácticos:**
-- Carro que se detiene → cuerpo continúa moviéndose hacia adelante (inercia)
-- Carrito vacío vs lleno → diferentes aceleraciones con misma fuerza
-- Caminar → pares de fuerzas acción-reacción
-
-**📖 Vista Previa de Próxima Sesión:**
-Aplicación de estas leyes al movimiento circular y fuerzas gravitacionales
-
-**⭐ Enfoque de Estudio:**
-Entender cómo estas tres leyes fundamentales explican los fenómenos de movimiento cotidianos""",
-                "chapters": """📖 **Estructura de la Clase: Leyes del Movimiento de Newton**
-
-**🎬 Introducción (0:00-2:30)**
-- Resumen del curso y tema de hoy
-- Importancia de las Leyes de Newton en la física
-
-**📚 Capítulo 1: Primera Ley de Newton - Ley de Inercia (2:30-8:45)**
-- Definición y explicación
-- Ejemplos del mundo real (escenario del carro que se detiene)
-- Entendimiento de la inercia en la vida diaria
-
-**⚖️ Capítulo 2: Segunda Ley de Newton - F=ma (8:45-15:20)**
-- Relación matemática entre fuerza, masa y aceleración
-- Demostración práctica: ejemplo del carrito de compras
-- Aplicaciones en resolución de problemas
-
-**🔄 Capítulo 3: Tercera Ley de Newton - Acción-Reacción (15:20-22:10)**
-- Principio de reacciones iguales y opuestas
-- Caminar como ejemplo de pares acción-reacción
-- Conceptos erróneos comunes abordados
-
-**🎯 Conclusión y Próximos Pasos (22:10-25:00)**
-- Resumen de las tres leyes
-- Vista previa de la próxima clase: movimiento circular y gravedad
-- Recomendaciones de estudio
-
-**💡 Puntos Clave:**
-Cada ley se basa en la anterior para crear un entendimiento completo de las dinámicas del movimiento"""
-            },
-            "fr": {
-                "full": """Bienvenue au cours de Physique d'aujourd'hui sur les Lois du Mouvement de Newton.
-
-Aujourd'hui, nous allons explorer les principes fondamentaux qui régissent comment les objets se déplacent et interagissent avec les forces. Commençons par la Première Loi de Newton, également connue sous le nom de Loi d'Inertie.
-
-La Première Loi de Newton énonce qu'un objet au repos reste au repos, et un objet en mouvement reste en mouvement à vitesse constante, sauf s'il est soumis à une force externe. Cela peut sembler évident, mais c'est en fait très profond quand on y réfléchit.
-
-Par exemple, si vous êtes assis dans une voiture et que la voiture s'arrête soudainement, votre corps continue de bouger vers l'avant. C'est parce que votre corps veut maintenir son état de mouvement - c'est l'inertie en action.
-
-Maintenant, passons à la Deuxième Loi de Newton, qui est probablement la plus célèbre : F égale ma. Force égale masse fois accélération. Cette loi nous dit que la force appliquée à un objet est directement proportionnelle à la masse de l'objet et à son accélération.
+        # Response cache keyed by audio content + job shape: the same file
+        # uploaded twice (retries, demos) reuses the stored answer instead of
+        # paying for another LLM call. Without an audio hash there is no
+        # content identity to key on, so the cache is skipped entirely rather
+        # than collapsing every hashless recording onto one shared entry
+        cache_key = None
+        cached = None
+        if audio_sha256:
+            cache_key = hashlib.sha256(f"{audio_sha256}|{processing_type}|{language}".encode()).hexdigest()
+            cached = await db.llm_cache.find_one({"_id": cache_key})
+        if cached:
+            result = cached["response"]
+        else:
+            # Spend a provider token only on a cache miss; once the real API
+            # call lands here it goes through llm_client.llm_retry as well
+            await _llm_rate_limiter.acquire()
+            # Get language-specific content or default to English
+            content = _CONTENT_BY_LANG[_LANG_IDX.get(language, 0)]
+            result = content.get(processing_type, content["full"])
+            if cache_key is not None:
+                await db.llm_cache.update_one(
+                    {"_id": cache_key},
+                    {"$set": {"response": result, "created_at": utcnow()}},
+                    upsert=True
+                )
+
+        field = _FIELD_BY_TYPE.get(processing_type)
+        if field is None:
+            raise ValueError(f"Unknown processing type: {processing_type}")
 
-Un exemple pratique : si vous poussez un chariot de courses avec la même force, un chariot vide accélérera beaucoup plus rapidement qu'un chariot plein. Même force, masse différente, accélération différente.
-
-Enfin, la Troisième Loi de Newton énonce que pour chaque action, il y a une réaction égale et opposée. Quand vous marchez, vous poussez vers l'arrière sur le sol, et le sol pousse vers l'avant sur vous.
-
-Ces trois lois forment la base de la mécanique classique et nous aident à comprendre le mouvement dans notre monde quotidien. Le prochain cours, nous explorerons comment ces lois s'appliquent au mouvement circulaire et à la gravité.""",
-                "summary": """📚 **Résumé du Cours de Physique : Lois du Mouvement de Newton**
-
-**🎯 Concepts Clés :**
-• **Première Loi de Newton (Loi d'Inertie)** : Les objets maintiennent leur état de mouvement sauf s'ils sont soumis à des forces externes
-• **Deuxième Loi de Newton** : F = ma (Force = masse × accélération)
-• **Troisième Loi de Newton** : Chaque action a une réaction égale et opposée
-
-**💡 Points Principaux :**
-1. **Inertie expliquée** : Les objets résistent aux changements de mouvement - démontré par l'exemple de la voiture qui s'arrête
-2. **Relation force-masse** : Même force sur différentes masses produit différentes accélérations (exemple du chariot de courses)
-3. **Paires action-réaction** : Marcher implique pousser le sol vers l'arrière, le sol pousse vers l'avant
-
-**🔍 Exemples Pratiques :**
-- Voiture qui s'arrête → corps continue à bouger vers l'avant (inertie)
-- Chariot vide vs plein → accélérations différentes avec même force
-- Marcher → paires de forces action-réaction
-
-**📖 Aperçu de la Prochaine Session :**
-Application de ces lois au mouvement circulaire et aux forces gravitationnelles
-
-**⭐ Focus d'Étude :**
-Comprendre comment ces trois lois fondamentales expliquent les phénomènes de mouvement quotidiens""",
-                "chapters": """📖 **Structure du Cours : Lois du Mouvement de Newton**
-
-**🎬 Introduction (0:00-2:30)**
-- Aperçu du cours et sujet d'aujourd'hui
-- Importance des Lois de Newton en physique
-
-**📚 Chapitre 1 : Première Loi de Newton - Loi d'Inertie (2:30-8:45)**
-- Définition et explication
-- Exemples du monde réel (scénario de la voiture qui s'arrête)
-- Compréhension de l'inertie dans la vie quotidienne
-
-**⚖️ Chapitre 2 : Deuxième Loi de Newton - F=ma (8:45-15:20)**
-- Relation mathématique entre force, masse et accélération
-- Démonstration pratique : exemple du chariot de courses
-- Applications dans la résolution de problèmes
-
-**🔄 Chapitre 3 : Troisième Loi de Newton - Action-Réaction (15:20-22:10)**
-- Principe des réactions égales et opposées
-- Marcher comme exemple de paires action-réaction
-- Idées fausses communes abordées
-
-**🎯 Conclusion et Prochaines Étapes (22:10-25:00)**
-- Résumé des trois lois
-- Aperçu du prochain cours : mouvement circulaire et gravité
-- Recommandations d'étude
-
-**💡 Points Clés :**
-Chaque loi s'appuie sur la précédente pour créer une compréhension complète des dynamiques du mouvement"""
-            },
-            "de": {
-                "full": """Willkommen zur heutigen Physikvorlesung über Newtons Bewegungsgesetze.
-
-Heute werden wir die grundlegenden Prinzipien erforschen, die bestimmen, wie sich Objekte bewegen und mit Kräften interagieren. Beginnen wir mit Newtons Erstem Gesetz, auch bekannt als Trägheitsgesetz.
-
-Newtons Erstes Gesetz besagt, dass ein Objekt in Ruhe in Ruhe bleibt, und ein Objekt in Bewegung in Bewegung bei konstanter Geschwindigkeit bleibt, es sei denn, es wird von einer äußeren Kraft beeinflusst. Das mag offensichtlich erscheinen, aber es ist tatsächlich sehr tiefgreifend, wenn man darüber nachdenkt.
-
-Zum Beispiel, wenn Sie in einem Auto sitzen und das Auto plötzlich anhält, bewegt sich Ihr Körper weiter nach vorne. Das liegt daran, dass Ihr Körper seinen Bewegungszustand beibehalten möchte - das ist Trägheit in Aktion.
-
-Nun gehen wir zu Newtons Zweitem Gesetz über, das wahrscheinlich das berühmteste ist: F gleich ma. Kraft gleich Masse mal Beschleunigung. Dieses Gesetz sagt uns, dass die auf ein Objekt angewendete Kraft direkt proportional zur Masse des Objekts und seiner Beschleunigung ist.
-
-Ein praktisches Beispiel: Wenn Sie einen Einkaufswagen mit der gleichen Kraft schieben, wird ein leerer Wagen viel schneller beschleunigen als ein voller Wagen. Gleiche Kraft, verschiedene Masse, verschiedene Beschleunigung.
-
-Schließlich besagt Newtons Drittes Gesetz, dass für jede Aktion eine gleiche und entgegengesetzte Reaktion existiert. Wenn Sie gehen, drücken Sie nach hinten auf den Boden, und der Boden drückt nach vorne auf Sie.
-
-Diese drei Gesetze bilden die Grundlage der klassischen Mechanik und helfen uns, Bewegung in unserer alltäglichen Welt zu verstehen. In der nächsten Vorlesung werden wir erforschen, wie diese Gesetze auf Kreisbewegung und Schwerkraft angewendet werden.""",
-                "summary": """📚 **Physikvorlesung Zusammenfassung: Newtons Bewegungsgesetze**
-
-**🎯 Schlüsselkonzepte:**
-• **Newtons Erstes Gesetz (Trägheitsgesetz)**: Objekte behalten ihren Bewegungszustand bei, es sei denn, sie werden von äußeren Kräften beeinflusst
-• **Newtons Zweites Gesetz**: F = ma (Kraft = Masse × Beschleunigung)
-• **Newtons Drittes Gesetz**: Jede Aktion hat eine gleiche und entgegengesetzte Reaktion
-
-**💡 Hauptpunkte:**
-1. **Trägheit erklärt**: Objekte widersetzen sich Änderungen in der Bewegung - demonstriert durch das Beispiel des anhaltenden Autos
-2. **Kraft-Masse-Beziehung**: Gleiche Kraft auf verschiedene Massen erzeugt verschiedene Beschleunigungen (Einkaufswagen-Beispiel)
-3. **Aktion-Reaktion-Paare**: Gehen beinhaltet das Drücken des Bodens nach hinten, Boden drückt nach vorne
-
-**🔍 Praktische Beispiele:**
-- Auto hält an → Körper bewegt sich weiter nach vorne (Trägheit)
-- Leerer vs voller Einkaufswagen → verschiedene Beschleunigungen mit gleicher Kraft
-- Gehen → Aktion-Reaktion-Kraftpaare
-
-**📖 Vorschau auf nächste Sitzung:**
-Anwendung dieser Gesetze auf Kreisbewegung und Gravitationskräfte
-
-**⭐ Studienfokus:**
-Verstehen, wie diese drei fundamentalen Gesetze alltägliche Bewegungsphänomene erklären""",
-                "chapters": """📖 **Vorlesungsstruktur: Newtons Bewegungsgesetze**
-
-**🎬 Einführung (0:00-2:30)**
-- Kursüberblick und heutiges Thema
-- Wichtigkeit von Newtons Gesetzen in der Physik
-
-**📚 Kapitel 1: Newtons Erstes Gesetz - Trägheitsgesetz (2:30-8:45)**
-- Definition und Erklärung
-- Beispiele aus der realen Welt (Szenario des anhaltenden Autos)
-- Verständnis von Trägheit im täglichen Leben
-
-**⚖️ Kapitel 2: Newtons Zweites Gesetz - F=ma (8:45-15:20)**
-- Mathematische Beziehung zwischen Kraft, Masse und Beschleunigung
-- Praktische Demonstration: Einkaufswagen-Beispiel
-- Anwendungen in der Problemlösung
-
-**🔄 Kapitel 3: Newtons Drittes Gesetz - Aktion-Reaktion (15:20-22:10)**
-- Prinzip gleicher und entgegengesetzter Reaktionen
-- Gehen als Beispiel für Aktion-Reaktion-Paare
-- Häufige Missverständnisse angesprochen
-
-**🎯 Fazit und nächste Schritte (22:10-25:00)**
-- Zusammenfassung der drei Gesetze
-- Vorschau auf nächste Vorlesung: Kreisbewegung und Schwerkraft
-- Studienempfehlungen
+        await db.recordings.update_one(
+            {"id": recording_id},
+            {"$set": {field: _compress_text(result), "status": "completed"}}
+        )
 
-**💡 Wichtige Erkenntnisse:**
-Jedes Gesetz baut auf dem vorherigen auf, um ein vollständiges Verständnis der Bewegungsdynamik zu schaffen"""
-            }
-        }
-        
-        # Get language-specific content or default to English
-        content = language_content.get(language, language_content["en"])
-        
-        if processing_type == "full":
-            transcript = content["full"]
-            await db.recordings.update_one(
-                {"id": recording_id},
-                {"$set": {"transcript": transcript, "status": "completed"}}
-            )
-            
-        elif processing_type == "summary":
-            summary = content["summary"]
-            await db.recordings.update_one(
-                {"id": recording_id},
-                {"$set": {"summary": summary, "status": "completed"}}
-            )
-            
-        elif processing_type == "chapters":
-            chapters = content["chapters"]
-            await db.recordings.update_one(
-                {"id": recording_id},
-                {"$set": {"summary": chapters, "status": "completed"}}
-            )
-            
     except Exception as e:
         logging.error(f"Error in mock AI processing: {str(e)}")
         await db.recordings.update_one(
@@ -487,46 +401,124 @@ async def get_profile(x_session_id: str = Header(None)):
         "session_token": x_session_id
     }
     
-    # Create or update user
-    existing_user = await db.users.find_one({"email": user_data["email"]})
-    if not existing_user:
-        user = User(**user_data)
-        await db.users.insert_one(user.dict())
-    else:
-        user = User(**existing_user)
-    
-    # Create session
-    session = Session(
-        user_id=user.id,
-        session_token=x_session_id,
-        expires_at=datetime.utcnow() + timedelta(days=7)
+    # Create-or-fetch in one round-trip: the $setOnInsert only fires when the
+    # email is new, otherwise the stored document comes straight back
+    user_doc = await db.users.find_one_and_update(
+        {"email": user_data["email"]},
+        {"$setOnInsert": User.model_validate(user_data).model_dump()},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+        projection=_USER_PROJECTION
     )
-    await db.sessions.insert_one(session.dict())
+    user = User.model_validate(user_doc)
     
+    # Create session (kept server-side for revocation/fallback); upsert on the
+    # token so re-login reuses the row, with created_at stamped by the server
+    await db.sessions.update_one(
+        {"session_token": x_session_id},
+        {
+            "$setOnInsert": {
+                "id": str(uuid6.uuid7()),
+                "user_id": user.id,
+                "expires_at": utcnow() + timedelta(days=7)
+            },
+            "$currentDate": {"created_at": True}
+        },
+        upsert=True
+    )
+
+    # Hand back a signed access token so later requests authenticate
+    # without a session lookup
+    user_data["session_token"] = issue_access_token(user)
     return user_data
 
+def _decode_and_hash(audio_data: str) -> tuple:
+    """Base64 decode plus sha256 in one pass; CPU-bound, run off the loop"""
+    audio_bytes = base64.b64decode(audio_data, validate=True)
+    return audio_bytes, hashlib.sha256(audio_bytes).hexdigest()
+
 # Recording Routes
 @api_router.post("/recordings", response_model=Recording)
 async def create_recording(recording_data: RecordingCreate, current_user: User = Depends(get_current_user)):
     """Create a new recording"""
+    # Decode off the event loop: a large base64 payload would otherwise
+    # block every other request for the duration
+    try:
+        audio_bytes, audio_sha256 = await asyncio.to_thread(_decode_and_hash, recording_data.audio_data)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid base64 audio data")
+    file_id = await audio_bucket.upload_from_stream(recording_data.title, audio_bytes)
+
     recording = Recording(
         user_id=current_user.id,
         title=recording_data.title,
-        audio_data=recording_data.audio_data,
+        audio_ref=str(file_id),
+        audio_sha256=audio_sha256,
         tags=recording_data.tags,
         notes=recording_data.notes,
         duration=recording_data.duration,
         status="uploaded"
     )
     
-    await db.recordings.insert_one(recording.dict())
+    await db.recordings.insert_one(recording.model_dump())
+    return recording
+
+@api_router.post("/recordings/upload", response_model=Recording)
+async def upload_recording(
+    file: UploadFile = File(...),
+    title: Optional[str] = Form(None),
+    duration: Optional[float] = Form(None),
+    current_user: User = Depends(get_current_user)
+):
+    """Upload audio as multipart and create a recording (no base64 overhead)"""
+    grid_in = audio_bucket.open_upload_stream(title or file.filename)
+    hasher = hashlib.sha256()
+    while chunk := await file.read(1024 * 1024):
+        hasher.update(chunk)
+        await grid_in.write(chunk)
+    await grid_in.close()
+
+    recording = Recording(
+        user_id=current_user.id,
+        title=title or file.filename,
+        audio_ref=str(grid_in._id),
+        audio_sha256=hasher.hexdigest(),
+        duration=duration,
+        status="uploaded"
+    )
+
+    await db.recordings.insert_one(recording.model_dump())
     return recording
 
-@api_router.get("/recordings", response_model=List[Recording])
+# Inclusion projection built from the summary model: adding a field to
+# RecordingSummary automatically includes it in list responses
+_RECORDING_SUMMARY_PROJECTION = {name: 1 for name in RecordingSummary.model_fields}
+_RECORDING_SUMMARY_PROJECTION["_id"] = 0
+
+@api_router.get("/recordings", response_model=None)
 async def get_recordings(current_user: User = Depends(get_current_user)):
-    """Get all recordings for the current user"""
-    recordings = await db.recordings.find({"user_id": current_user.id}).sort("created_at", -1).to_list(100)
-    return [Recording(**recording) for recording in recordings]
+    """Stream all recordings for the current user (metadata only)"""
+    projection = _RECORDING_SUMMARY_PROJECTION
+    # batch_size keeps each BSON decode burst bounded so the event loop
+    # breathes between batches instead of decoding all 100 docs in one await
+    cursor = db.recordings.find({"user_id": current_user.id}, projection).sort("created_at", -1).batch_size(25).limit(100)
+
+    # Emit each document as it arrives from the cursor: first byte leaves as
+    # soon as the first doc is decoded and peak memory stays O(1 doc)
+    async def stream_docs():
+        yield b"["
+        first = True
+        async for doc in cursor:
+            prefix = b"" if first else b","
+            first = False
+            yield prefix + orjson.dumps(doc)
+        yield b"]"
+
+    return StreamingResponse(stream_docs(), media_type="application/json")
+
+# Serializer specialized once for the Recording schema: dump_json goes
+# straight through pydantic_core instead of the generic jsonable_encoder
+_RECORDING_ADAPTER = TypeAdapter(Recording)
 
 @api_router.get("/recordings/{recording_id}", response_model=Recording)
 async def get_recording(recording_id: str, current_user: User = Depends(get_current_user)):
@@ -534,27 +526,50 @@ async def get_recording(recording_id: str, current_user: User = Depends(get_curr
     recording = await db.recordings.find_one({"id": recording_id, "user_id": current_user.id})
     if not recording:
         raise HTTPException(status_code=404, detail="Recording not found")
-    return Recording(**recording)
+    for field in ("transcript", "summary"):
+        if recording.get(field) is not None:
+            recording[field] = _decompress_text(recording[field])
+    payload = _RECORDING_ADAPTER.dump_json(Recording.model_construct(**recording))
+    return Response(content=payload, media_type="application/json")
+
+@api_router.get("/recordings/{recording_id}/audio")
+async def get_recording_audio(recording_id: str, current_user: User = Depends(get_current_user)):
+    """Stream the raw audio bytes for a recording from GridFS"""
+    recording = await db.recordings.find_one({"id": recording_id, "user_id": current_user.id}, {"audio_ref": 1})
+    if not recording or not recording.get("audio_ref"):
+        raise HTTPException(status_code=404, detail="Recording audio not found")
+
+    grid_out = await audio_bucket.open_download_stream(ObjectId(recording["audio_ref"]))
+
+    async def stream_chunks():
+        while chunk := await grid_out.readchunk():
+            yield chunk
+
+    return StreamingResponse(stream_chunks(), media_type="application/octet-stream")
 
 @api_router.post("/recordings/{recording_id}/process", response_model=ProcessingResponse)
 async def process_recording(recording_id: str, request: TranscriptionRequest, current_user: User = Depends(get_current_user)):
     """Process recording for transcription/summarization"""
-    recording = await db.recordings.find_one({"id": recording_id, "user_id": current_user.id})
-    if not recording:
-        raise HTTPException(status_code=404, detail="Recording not found")
-    
-    # Update status to processing
-    await db.recordings.update_one(
-        {"id": recording_id},
-        {"$set": {"status": "processing"}}
+    # One atomic round-trip: flip status to "processing", treat a miss as
+    # 404, and pull the content hash for the job in the same operation
+    doc = await db.recordings.find_one_and_update(
+        {"id": recording_id, "user_id": current_user.id},
+        {"$set": {"status": "processing"}},
+        projection={"_id": 0, "audio_sha256": 1}
     )
-    
+    if doc is None:
+        raise HTTPException(status_code=404, detail="Recording not found")
+
     # Use user's preferred language or request language
     language = request.language if request.language else current_user.preferred_language
-    
-    # Process in background with language support
-    asyncio.create_task(process_audio_with_ai(recording_id, recording["audio_data"], request.type, language))
-    
+
+    # Enqueue for the worker pool; coalesce duplicate clicks onto the job
+    # that is already queued or running
+    inflight_key = (recording_id, request.type, language)
+    if inflight_key not in _inflight_processing:
+        _inflight_processing[inflight_key] = True
+        await _processing_queue.put((recording_id, request.type, language, doc.get("audio_sha256")))
+
     return ProcessingResponse(
         message=f"Processing started for {request.type} transcription in {language}",
         recording_id=recording_id,
@@ -564,9 +579,22 @@ async def process_recording(recording_id: str, request: TranscriptionRequest, cu
 @api_router.delete("/recordings/{recording_id}")
 async def delete_recording(recording_id: str, current_user: User = Depends(get_current_user)):
     """Delete a recording"""
-    result = await db.recordings.delete_one({"id": recording_id, "user_id": current_user.id})
-    if result.deleted_count == 0:
+    # Pull the GridFS reference in the same round trip as the delete so the
+    # stored audio goes away with the metadata instead of leaking
+    doc = await db.recordings.find_one_and_delete(
+        {"id": recording_id, "user_id": current_user.id},
+        projection={"_id": 0, "audio_ref": 1}
+    )
+    if doc is None:
         raise HTTPException(status_code=404, detail="Recording not found")
+
+    audio_ref = doc.get("audio_ref")
+    if audio_ref:
+        try:
+            await audio_bucket.delete(ObjectId(audio_ref))
+        except NoFile:
+            logger.warning(f"Audio file {audio_ref} for recording {recording_id} already gone")
+
     return {"message": "Recording deleted successfully"}
 
 @api_router.put("/recordings/{recording_id}")
@@ -590,40 +618,112 @@ async def update_recording(recording_id: str, update_data: dict, current_user: U
 
 # User Routes
 @api_router.get("/user/profile", response_model=User)
-async def get_user_profile(current_user: User = Depends(get_current_user)):
+async def get_user_profile(response: Response,
+                           current_user: User = Depends(get_current_user),
+                           if_none_match: Optional[str] = Header(None)):
     """Get current user profile"""
+    # Weak ETag from the write-bumped version counter: an unchanged profile
+    # revalidates with an empty 304 instead of a full body
+    etag = f'W/"{current_user.id}-{current_user.version}"'
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return current_user
 
+# Debounce rapid language toggles: while a user flips through the picker only
+# the last choice inside the window reaches Mongo
+_LANGUAGE_WRITE_DELAY = 0.5
+_pending_language_writes: dict = {}
+
+async def _flush_language_write(user_id: str):
+    """Write the most recent pending language choice for a user"""
+    new_language = _pending_language_writes.pop(user_id, None)
+    if new_language is None:
+        return
+    result = await db.users.update_one(
+        {"id": user_id},
+        {"$set": {"preferred_language": new_language}, "$inc": {"version": 1}}
+    )
+    if result.matched_count == 0:
+        logger.warning(f"Language write for missing user {user_id}")
+    _invalidate_user_caches(user_id)
+
 @api_router.put("/user/language")
-async def update_user_language(language_data: dict, current_user: User = Depends(get_current_user)):
+async def update_user_language(language_data: LanguageUpdate, current_user: User = Depends(get_current_user)):
     """Update user's preferred language"""
-    supported_languages = ["en", "it", "es", "fr", "de"]
-    new_language = language_data.get("language", "en")
-    
-    if new_language not in supported_languages:
-        raise HTTPException(status_code=400, detail="Unsupported language")
-    
-    # Update user's preferred language
-    await db.users.update_one(
-        {"id": current_user.id},
-        {"$set": {"preferred_language": new_language}}
-    )
-    
-    return {"message": f"Language updated to {new_language}", "language": new_language}
+    new_language = language_data.language
+
+    # Record the choice and schedule one flush per user per window; repeat
+    # calls inside the window just overwrite the pending value
+    scheduled = current_user.id in _pending_language_writes
+    _pending_language_writes[current_user.id] = new_language
+    if not scheduled:
+        loop = asyncio.get_running_loop()
+        loop.call_later(
+            _LANGUAGE_WRITE_DELAY,
+            lambda: asyncio.ensure_future(_flush_language_write(current_user.id))
+        )
+
+    return _LANG_RESPONSES[new_language]
+
+async def _get_referral_code(user_id: str) -> Optional[str]:
+    """Referral code for a user; cached for an hour since it never changes"""
+    code = _referral_code_cache.get(user_id)
+    if code is None:
+        doc = await db.users.find_one({"id": user_id}, {"_id": 0, "referral_code": 1})
+        code = (doc or {}).get("referral_code")
+        if code is not None:
+            _referral_code_cache[user_id] = code
+    return code
+
+def _monthly_cost(discount: float) -> float:
+    return max(2.0 - discount, 1.0)  # Minimum €1.00
+
+async def _get_discount_info(user_id: str) -> tuple:
+    """(discount, monthly_cost) for a user; short TTL so referrals show up quickly"""
+    info = _discount_cache.get(user_id)
+    if info is None:
+        doc = await db.users.find_one(
+            {"id": user_id}, {"_id": 0, "discount_amount": 1, "monthly_cost": 1}
+        ) or {}
+        discount = doc.get("discount_amount", 0.0)
+        # Legacy documents predate the denormalized field
+        monthly = doc.get("monthly_cost", _monthly_cost(discount))
+        info = (discount, monthly)
+        _discount_cache[user_id] = info
+    return info
 
 @api_router.get("/user/referral")
 async def get_referral_info(current_user: User = Depends(get_current_user)):
     """Get referral code and discount info"""
+    referral_code = await _get_referral_code(current_user.id)
+    discount, monthly = await _get_discount_info(current_user.id)
     return {
-        "referral_code": current_user.referral_code,
-        "discount_amount": current_user.discount_amount,
-        "monthly_cost": max(2.0 - current_user.discount_amount, 1.0)  # Minimum €1.00
+        "referral_code": referral_code,
+        "discount_amount": discount,
+        "monthly_cost": monthly
+    }
+
+@api_router.get("/user/me")
+async def get_user_me(current_user: User = Depends(get_current_user)):
+    """Profile and referral info in one round trip for the initial page load"""
+    discount, monthly = await _get_discount_info(current_user.id)
+    return {
+        "profile": current_user,
+        "referral": {
+            "referral_code": current_user.referral_code,
+            "discount_amount": discount,
+            "monthly_cost": monthly
+        }
     }
 
-# Health check
+# Health check: the payload never changes, so serialize it once and hand
+# load balancer probes prebuilt bytes
+_HEALTH_BODY = orjson.dumps({"message": "SmartNotes API is running"})
+
 @api_router.get("/")
 async def root():
-    return {"message": "SmartNotes API is running"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -631,18 +731,54 @@ app.include_router(api_router)
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=os.environ.get('CORS_ORIGINS', 'http://localhost:3000').split(','),
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Authorization", "Content-Type", "X-Session-ID"],
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
-# Configure logging
+# Configure logging once at import. The supervisor (systemd/docker) already
+# timestamps every line, so skip the per-record strftime that %(asctime)s
+# would cost on the hot path.
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(levelname)s - %(name)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
-@app.on_event("shutdown")
+async def create_db_indexes():
+    # Back the hot query paths with indexes so they never fall back to a
+    # collection scan as the data grows
+    await db.recordings.create_index([("user_id", 1), ("created_at", -1)], background=True)
+    await db.recordings.create_index([("id", 1), ("user_id", 1)], unique=True, background=True)
+    await db.sessions.create_index("session_token", unique=True, background=True)
+    # Mongo TTL-expires sessions itself once expires_at passes
+    await db.sessions.create_index("expires_at", expireAfterSeconds=0, background=True)
+    await db.users.create_index("email", unique=True, background=True)
+    await db.users.create_index("id", unique=True, background=True)
+    await db.users.create_index("referral_code", unique=True, sparse=True, background=True)
+    # Cached LLM responses expire after a day
+    await db.llm_cache.create_index("created_at", expireAfterSeconds=86400, background=True)
+
+async def start_processing_workers():
+    for _ in range(PROCESSING_WORKER_COUNT):
+        _worker_tasks.append(asyncio.create_task(_processing_worker()))
+
+async def create_http_client():
+    # Shared HTTP/2 connection pool for outbound LLM calls, so each call
+    # multiplexes over kept-alive connections instead of paying TCP+TLS setup
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        timeout=60
+    )
+
+async def stop_processing_workers():
+    for task in _worker_tasks:
+        task.cancel()
+
+async def close_http_client():
+    await app.state.http.aclose()
+
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    await client.close()
\ No newline at end of file
@@ -4,58 +4,162 @@ SmartNotes Multilingual Backend Testing Suite
 Comprehensive testing of multilingual features as requested
 """
 
-import requests
-import json
+import httpx
+import asyncio
+import orjson
+import numpy as np
+import io
+import sys
+import re
 import base64
 import time
+import types
 import uuid
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv('/app/frontend/.env')
-
-# Configuration
+# Configuration — resolved from the plain environment at import time;
+# _init_env refreshes it from the frontend .env when run as a script
 BASE_URL = os.getenv('REACT_APP_BACKEND_URL', 'https://8e812a6d-619e-4f0d-90a9-76273db9a6ed.preview.emergentagent.com')
 API_BASE = f"{BASE_URL}/api"
 
+
+def _init_env():
+    """Pull the frontend .env into the environment and re-resolve the API base.
+
+    The dotenv import and its file I/O stay off the module import path, so
+    importing this module for its tester class costs nothing extra.
+    """
+    global BASE_URL, API_BASE
+    from dotenv import load_dotenv
+    load_dotenv('/app/frontend/.env')
+    BASE_URL = os.getenv('REACT_APP_BACKEND_URL', BASE_URL)
+    API_BASE = f"{BASE_URL}/api"
+
 # Test data
 TEST_SESSION_ID = "multilingual-test-" + str(uuid.uuid4())
 TEST_AUDIO_DATA = base64.b64encode(b"fake-audio-data-for-multilingual-testing").decode('utf-8')
 
+# Immutable language and processing-mode tables shared by the test methods
+SUPPORTED_LANGUAGES = (
+    ("en", "English"),
+    ("it", "Italian"),
+    ("es", "Spanish"),
+    ("fr", "French"),
+    ("de", "German")
+)
+PROCESSING_MODES = (
+    ('full', 'Full Transcription'),
+    ('summary', 'Smart Summarization'),
+    ('chapters', 'Chapter Detection')
+)
+LANGUAGE_NAMES = types.MappingProxyType(dict(SUPPORTED_LANGUAGES))
+
+# Language-specific validation keywords, compiled once into a single
+# alternation per language so each transcript is scanned in one C-level pass
+LANGUAGE_KEYWORDS = {
+    "en": ["Newton's Laws", "Physics", "motion", "force"],
+    "it": ["Leggi di Newton", "Fisica", "movimento", "forza", "moto"],
+    "es": ["Leyes de Newton", "Física", "movimiento", "fuerza"],
+    "fr": ["Lois de Newton", "Physique", "mouvement", "force"],
+    "de": ["Newtons Gesetze", "Physik", "Bewegung", "Kraft"]
+}
+LANG_PATTERNS = {code: re.compile('|'.join(map(re.escape, kws))) for code, kws in LANGUAGE_KEYWORDS.items()}
+# UTF-8 forms of the same keywords, matched against the raw response bytes
+# (orjson emits unescaped UTF-8) to reject keyword-free bodies without
+# touching the decoded fields
+LANGUAGE_KEYWORDS_BYTES = {code: tuple(kw.encode('utf-8') for kw in kws)
+                           for code, kws in LANGUAGE_KEYWORDS.items()}
+
+# Required response fields per endpoint; one set difference replaces the
+# two-pass membership scan + missing-field rebuild
+_AUTH_FIELDS = frozenset({'id', 'email', 'name', 'session_token'})
+_RECORDING_FIELDS = frozenset({'id', 'user_id', 'title', 'audio_ref', 'status'})
+_PROFILE_FIELDS = frozenset({'id', 'email', 'name', 'subscription_status', 'referral_code', 'preferred_language'})
+_REFERRAL_FIELDS = frozenset({'referral_code', 'discount_amount', 'monthly_cost'})
+
+# The two recording POST bodies never vary, so serialize them once and send
+# the raw bytes instead of re-encoding the base64 audio payload per request
+_MAIN_RECORDING_BODY = orjson.dumps({
+    'title': 'Multilingual Test Physics Lecture',
+    'audio_data': TEST_AUDIO_DATA,
+    'tags': ['physics', 'multilingual', 'test'],
+    'notes': 'Test recording for multilingual backend validation',
+    'duration': 180.5
+})
+_DELETE_RECORDING_BODY = orjson.dumps({
+    'title': 'Test Recording for Deletion',
+    'audio_data': TEST_AUDIO_DATA,
+    'tags': ['test', 'delete'],
+    'notes': 'This recording will be deleted',
+    'duration': 60.0
+})
+
+@dataclass(slots=True)
+class Results:
+    """Per-category outcomes; attribute access avoids dict lookups"""
+    health_check: bool = False
+    user_auth: bool = False
+    language_preferences: dict = field(default_factory=lambda: {'total': 5, 'passed': 0})
+    audio_storage: bool = False
+    multilingual_ai: dict = field(default_factory=lambda: {'total': 15, 'passed': 0, 'skipped': 0})
+    recording_management: dict = field(default_factory=lambda: {'total': 3, 'passed': 0})
+    user_profile: bool = False
+
 class MultilingualTester:
-    def __init__(self):
+    def __init__(self, serial=False):
+        # --serial runs the AI combinations one at a time over the sync
+        # client; useful when debugging since the output stays in order
+        self._serial = serial
         self.session_token = None
         self.user_id = None
         self.test_recording_id = None
-        self.results = {
-            'health_check': False,
-            'user_auth': False,
-            'language_preferences': {'total': 5, 'passed': 0},
-            'audio_storage': False,
-            'multilingual_ai': {'total': 15, 'passed': 0},
-            'recording_management': {'total': 3, 'passed': 0},
-            'user_profile': False
-        }
-        
+        self._delete_target_id = None
+        self._json_headers = None
+        self._consecutive_5xx = 0
+        self._skipped_combinations = 0
+        # Test output accumulates here and is flushed in one write before the
+        # summary; only failures print immediately
+        self._log_buf = io.StringIO()
+        # Where immediate failure lines go; json mode retargets this to
+        # stderr so stdout stays a single machine-readable line
+        self._live_stream = sys.stdout
+        # One HTTP/2 client for the whole run: every request multiplexes over
+        # a single kept-alive connection instead of handshaking per call
+        self.session = httpx.Client(
+            http2=True,
+            timeout=15,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=16),
+            headers={'Accept-Encoding': 'gzip, br'}
+        )
+        self.results = Results()
+        
+    @staticmethod
+    def _json(response):
+        """Decode a response body with orjson (C parser, skips stdlib json)"""
+        return orjson.loads(response.content)
+
     def log_result(self, test_name, success, message, details=None):
-        """Log test result"""
+        """Buffer a test result; failures also print immediately"""
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status}: {test_name} - {message}")
+        line = f"{status}: {test_name} - {message}\n"
         if details:
-            print(f"   Details: {details}")
+            line += f"   Details: {details}\n"
+        self._log_buf.write(line)
+        if not success:
+            self._live_stream.write(line)
     
     def test_health_check(self):
         """Test 1: Health Check - Verify API is running"""
-        print("\n=== 1. HEALTH CHECK ===")
+        self._log_buf.write("\n=== 1. HEALTH CHECK ===\n")
         try:
-            response = requests.get(f"{API_BASE}/", timeout=10)
+            response = self.session.get(f"{API_BASE}/", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = self._json(response)
                 if "SmartNotes API is running" in data.get('message', ''):
                     self.log_result("Health Check", True, "API is running correctly")
-                    self.results['health_check'] = True
+                    self.results.health_check = True
                     return True
                 else:
                     self.log_result("Health Check", False, f"Unexpected response: {data}")
@@ -69,25 +173,29 @@ class MultilingualTester:
     
     def test_user_authentication(self):
         """Test 2: User Authentication - Test auth system"""
-        print("\n=== 2. USER AUTHENTICATION ===")
+        self._log_buf.write("\n=== 2. USER AUTHENTICATION ===\n")
         try:
             headers = {'X-Session-ID': TEST_SESSION_ID}
-            response = requests.get(f"{API_BASE}/auth/profile", headers=headers, timeout=10)
+            response = self.session.get(f"{API_BASE}/auth/profile", headers=headers, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                required_fields = ['id', 'email', 'name', 'session_token']
-                
-                if all(field in data for field in required_fields):
+                data = self._json(response)
+                missing = _AUTH_FIELDS - data.keys()
+
+                if not missing:
                     self.session_token = data['session_token']
                     self.user_id = data['id']
+                    self.session.headers['Authorization'] = f'Bearer {self.session_token}'
+                    self._json_headers = {
+                        'Authorization': f'Bearer {self.session_token}',
+                        'Content-Type': 'application/json'
+                    }
                     self.log_result("User Authentication", True, "Profile endpoint working correctly", 
                                   f"User: {data['name']} ({data['email']})")
-                    self.results['user_auth'] = True
+                    self.results.user_auth = True
                     return True
                 else:
-                    missing = [f for f in required_fields if f not in data]
-                    self.log_result("User Authentication", False, f"Missing required fields: {missing}")
+                    self.log_result("User Authentication", False, f"Missing required fields: {sorted(missing)}")
                     return False
             else:
                 self.log_result("User Authentication", False, f"HTTP {response.status_code}: {response.text}")
@@ -98,73 +206,58 @@ class MultilingualTester:
     
     def test_user_language_preferences(self):
         """Test 3: User Language Preferences - Test all 5 languages (en, it, es, fr, de)"""
-        print("\n=== 3. USER LANGUAGE PREFERENCES ===")
+        self._log_buf.write("\n=== 3. USER LANGUAGE PREFERENCES ===\n")
         if not self.session_token:
             self.log_result("User Language Preferences", False, "No session token available")
             return False
         
         success_count = 0
-        supported_languages = ["en", "it", "es", "fr", "de"]
-        language_names = {
-            "en": "English",
-            "it": "Italian", 
-            "es": "Spanish",
-            "fr": "French",
-            "de": "German"
-        }
+        supported_languages = [code for code, _ in SUPPORTED_LANGUAGES]
         
+        def _put_lang(code):
+            return self.session.put(f"{API_BASE}/user/language",
+                                    headers=self._json_headers,
+                                    json={'language': code},
+                                    timeout=10)
+
+        # All six PUTs are independent, so fan them out and collect results
+        # in order — wall time drops from six round trips to roughly one
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = {code: executor.submit(_put_lang, code)
+                       for code in supported_languages + ['invalid']}
+
         for lang_code in supported_languages:
             try:
-                headers = {
-                    'Authorization': f'Bearer {self.session_token}',
-                    'Content-Type': 'application/json'
-                }
-                
-                language_data = {'language': lang_code}
-                
-                response = requests.put(f"{API_BASE}/user/language",
-                                      headers=headers,
-                                      json=language_data,
-                                      timeout=10)
-                
+                response = futures[lang_code].result()
+
                 if response.status_code == 200:
-                    data = response.json()
+                    data = self._json(response)
                     if data.get('language') == lang_code and 'updated' in data.get('message', '').lower():
-                        self.log_result(f"Language Update ({language_names[lang_code]})", True, 
-                                      f"Language successfully updated to {language_names[lang_code]} ({lang_code})")
+                        self.log_result(f"Language Update ({LANGUAGE_NAMES[lang_code]})", True, 
+                                      f"Language successfully updated to {LANGUAGE_NAMES[lang_code]} ({lang_code})")
                         success_count += 1
                     else:
-                        self.log_result(f"Language Update ({language_names[lang_code]})", False, 
+                        self.log_result(f"Language Update ({LANGUAGE_NAMES[lang_code]})", False, 
                                       f"Unexpected response: {data}")
                 else:
-                    self.log_result(f"Language Update ({language_names[lang_code]})", False, 
+                    self.log_result(f"Language Update ({LANGUAGE_NAMES[lang_code]})", False, 
                                   f"HTTP {response.status_code}: {response.text}")
             except Exception as e:
-                self.log_result(f"Language Update ({language_names[lang_code]})", False, 
+                self.log_result(f"Language Update ({LANGUAGE_NAMES[lang_code]})", False, 
                               f"Request error: {str(e)}")
         
         # Test invalid language validation
         try:
-            headers = {
-                'Authorization': f'Bearer {self.session_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            language_data = {'language': 'invalid'}
-            
-            response = requests.put(f"{API_BASE}/user/language",
-                                  headers=headers,
-                                  json=language_data,
-                                  timeout=10)
-            
-            if response.status_code == 400:
+            response = futures['invalid'].result()
+
+            if response.status_code == 422:
                 self.log_result("Language Validation", True, "Invalid language properly rejected")
             else:
-                self.log_result("Language Validation", False, f"Expected 400, got {response.status_code}")
+                self.log_result("Language Validation", False, f"Expected 422, got {response.status_code}")
         except Exception as e:
             self.log_result("Language Validation", False, f"Request error: {str(e)}")
         
-        self.results['language_preferences']['passed'] = success_count
+        self.results.language_preferences['passed'] = success_count
         
         if success_count == 5:
             self.log_result("User Language Preferences", True, f"All 5 language updates successful")
@@ -175,43 +268,42 @@ class MultilingualTester:
 
     def test_audio_recording_storage(self):
         """Test 4: Audio Recording Storage - Test recording creation"""
-        print("\n=== 4. AUDIO RECORDING STORAGE ===")
+        self._log_buf.write("\n=== 4. AUDIO RECORDING STORAGE ===\n")
         if not self.session_token:
             self.log_result("Audio Recording Storage", False, "No session token available")
             return False
             
         try:
-            headers = {
-                'Authorization': f'Bearer {self.session_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            recording_data = {
-                'title': 'Multilingual Test Physics Lecture',
-                'audio_data': TEST_AUDIO_DATA,
-                'tags': ['physics', 'multilingual', 'test'],
-                'notes': 'Test recording for multilingual backend validation',
-                'duration': 180.5
-            }
-            
-            response = requests.post(f"{API_BASE}/recordings", 
-                                   headers=headers, 
-                                   json=recording_data, 
-                                   timeout=15)
-            
+            # Create the main recording and the disposable DELETE-test target
+            # in one round trip's worth of wall time
+            def _post_recording(body):
+                return self.session.post(f"{API_BASE}/recordings",
+                                         headers=self._json_headers,
+                                         content=body,
+                                         timeout=15)
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                main_future = executor.submit(_post_recording, _MAIN_RECORDING_BODY)
+                delete_future = executor.submit(_post_recording, _DELETE_RECORDING_BODY)
+
+            delete_response = delete_future.result()
+            if delete_response.status_code == 200:
+                self._delete_target_id = self._json(delete_response).get('id')
+
+            response = main_future.result()
+
             if response.status_code == 200:
-                data = response.json()
-                required_fields = ['id', 'user_id', 'title', 'audio_data', 'status']
-                
-                if all(field in data for field in required_fields):
+                data = self._json(response)
+                missing = _RECORDING_FIELDS - data.keys()
+
+                if not missing:
                     self.test_recording_id = data['id']
                     self.log_result("Audio Recording Storage", True, "Recording created successfully",
                                   f"Recording ID: {data['id']}, Status: {data['status']}")
-                    self.results['audio_storage'] = True
+                    self.results.audio_storage = True
                     return True
                 else:
-                    missing = [f for f in required_fields if f not in data]
-                    self.log_result("Audio Recording Storage", False, f"Missing fields in response: {missing}")
+                    self.log_result("Audio Recording Storage", False, f"Missing fields in response: {sorted(missing)}")
                     return False
             else:
                 self.log_result("Audio Recording Storage", False, f"HTTP {response.status_code}: {response.text}")
@@ -222,115 +314,229 @@ class MultilingualTester:
 
     def test_multilingual_ai_processing(self):
         """Test 5: Multilingual AI Processing - Test all 15 combinations (5 languages × 3 modes)"""
-        print("\n=== 5. MULTILINGUAL AI PROCESSING ===")
+        self._log_buf.write("\n=== 5. MULTILINGUAL AI PROCESSING ===\n")
         if not self.session_token or not self.test_recording_id:
             self.log_result("Multilingual AI Processing", False, "No session token or recording ID available")
             return False
         
-        success_count = 0
         total_tests = 15  # 5 languages × 3 modes
+
+        self._log_buf.write(f"Testing {total_tests} combinations (5 languages × 3 modes)...\n")
+
+        # All 15 combinations are independent and I/O-bound, so they run
+        # concurrently instead of serially stacking up the 3s waits;
+        # --serial keeps the old one-at-a-time path for debugging
+        if self._serial:
+            success_count = self._run_multilingual_ai_serial()
+        else:
+            success_count = asyncio.run(self._run_multilingual_ai())
+
+        self.results.multilingual_ai['passed'] = success_count
         
-        languages = [
-            ("en", "English"),
-            ("it", "Italian"),
-            ("es", "Spanish"), 
-            ("fr", "French"),
-            ("de", "German")
-        ]
-        
-        processing_modes = [
-            ('full', 'Full Transcription'),
-            ('summary', 'Smart Summarization'),
-            ('chapters', 'Chapter Detection')
+        # Overall result
+        if success_count >= 12:  # Allow some tolerance for async processing
+            self.log_result("Multilingual AI Processing", True, 
+                          f"{success_count}/{total_tests} multilingual AI processing tests successful")
+            return True
+        else:
+            self.log_result("Multilingual AI Processing", False, 
+                          f"Only {success_count}/{total_tests} multilingual processing tests successful")
+            return False
+
+    async def _run_multilingual_ai(self):
+        """Fan all 15 language × mode combinations out over one async client"""
+        self._consecutive_5xx = 0
+        self._skipped_combinations = 0
+        # Bounded concurrency keeps a few jobs in flight at a time, so when
+        # the backend is down the breaker trips after three straight 5xx
+        # responses instead of all 15 combinations failing in parallel
+        semaphore = asyncio.Semaphore(5)
+        limits = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        headers = {
+            'Authorization': f'Bearer {self.session_token}',
+            'Accept-Encoding': 'gzip, br'
+        }
+        combos = [
+            (lang_code, lang_name, mode_type, mode_name)
+            for lang_code, lang_name in SUPPORTED_LANGUAGES
+            for mode_type, mode_name in PROCESSING_MODES
         ]
-        
-        print(f"Testing {total_tests} combinations (5 languages × 3 modes)...")
-        
-        for lang_code, lang_name in languages:
-            print(f"\n--- Testing {lang_name} ({lang_code}) ---")
-            for mode_type, mode_name in processing_modes:
+        async with httpx.AsyncClient(timeout=15, limits=limits, headers=headers) as client:
+            # Each combination processes its own recording: the jobs write the
+            # recording's transcript/summary fields, so sharing one target
+            # would let concurrent jobs overwrite each other's output before
+            # the matching verifier reads it
+            created = await asyncio.gather(*[
+                client.post(f"{API_BASE}/recordings",
+                            headers={'Content-Type': 'application/json'},
+                            content=_MAIN_RECORDING_BODY)
+                for _ in combos
+            ])
+            recording_ids = []
+            for create_response in created:
+                if create_response.status_code != 200:
+                    self.log_result("Multilingual AI Processing", False,
+                                  f"Failed to create per-combination recording: "
+                                  f"HTTP {create_response.status_code}")
+                    return 0
+                recording_ids.append(self._json(create_response)['id'])
+
+            tasks = [
+                self._process_one(semaphore, client, recording_id, *combo)
+                for recording_id, combo in zip(recording_ids, combos)
+            ]
+            outcomes = await asyncio.gather(*tasks)
+        if self._skipped_combinations:
+            self._log_buf.write(f"Circuit tripped: skipped {self._skipped_combinations} remaining combinations\n")
+            self.results.multilingual_ai['skipped'] = self._skipped_combinations
+        return sum(outcomes)
+
+    async def _process_one(self, semaphore, client, recording_id, lang_code, lang_name, mode_type, mode_name):
+        """Start one processing job, wait, and verify its outcome"""
+        async with semaphore:
+            if self._consecutive_5xx >= 3:
+                self._skipped_combinations += 1
+                return False
+            try:
+                processing_data = {
+                    'recording_id': recording_id,
+                    'type': mode_type,
+                    'language': lang_code
+                }
+
+                response = await client.post(f"{API_BASE}/recordings/{recording_id}/process",
+                                             json=processing_data)
+
+                if response.status_code >= 500:
+                    self._consecutive_5xx += 1
+                elif response.status_code == 200:
+                    self._consecutive_5xx = 0
+
+                if response.status_code == 200:
+                    data = self._json(response)
+                    if data.get('status') == 'processing' and lang_code in data.get('message', ''):
+                        self.log_result(f"AI {mode_name} ({lang_name})", True,
+                                      f"{mode_name} processing started in {lang_name}",
+                                      f"Language: {lang_code}, Status: {data['status']}")
+
+                        # Poll until processing finishes instead of a fixed wait
+                        verify_response, verify_data = await self._poll_recording(client, recording_id)
+                        return self._check_processing_response(verify_response, mode_type, mode_name, lang_code, lang_name,
+                                                               data=verify_data)
+                    else:
+                        self.log_result(f"AI {mode_name} ({lang_name})", False,
+                                      f"Unexpected response: {data}")
+                else:
+                    self.log_result(f"AI {mode_name} ({lang_name})", False,
+                                  f"HTTP {response.status_code}: {response.text}")
+            except Exception as e:
+                self.log_result(f"AI {mode_name} ({lang_name})", False,
+                              f"Request error: {str(e)}")
+            return False
+
+    async def _poll_recording(self, client, recording_id, timeout=10):
+        """Fetch the recording with exponential backoff until it leaves 'processing'.
+
+        Returns the last response and its decoded body (None on HTTP error) so
+        the verdict helper does not parse the same bytes a second time; a
+        still-processing recording is already acceptable to it.
+        """
+        delay = 0.1
+        deadline = time.monotonic() + timeout
+        while True:
+            response = await client.get(f"{API_BASE}/recordings/{recording_id}")
+            if response.status_code != 200:
+                return response, None
+            data = self._json(response)
+            if data.get('status') != 'processing':
+                return response, data
+            if time.monotonic() + delay > deadline:
+                return response, data
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.5)
+
+    def _run_multilingual_ai_serial(self):
+        """Run the 15 combinations one at a time over the sync client.
+
+        Slower than the async fan-out but strictly ordered, which makes a
+        failing combination easy to isolate; with only one job in flight the
+        main test recording can be shared safely.
+        """
+        success_count = 0
+        for lang_code, lang_name in SUPPORTED_LANGUAGES:
+            for mode_type, mode_name in PROCESSING_MODES:
                 try:
-                    headers = {
-                        'Authorization': f'Bearer {self.session_token}',
-                        'Content-Type': 'application/json'
-                    }
-                    
                     processing_data = {
                         'recording_id': self.test_recording_id,
                         'type': mode_type,
                         'language': lang_code
                     }
-                    
-                    response = requests.post(f"{API_BASE}/recordings/{self.test_recording_id}/process",
-                                           headers=headers,
-                                           json=processing_data,
-                                           timeout=15)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get('status') == 'processing' and lang_code in data.get('message', ''):
-                            self.log_result(f"AI {mode_name} ({lang_name})", True, 
-                                          f"{mode_name} processing started in {lang_name}",
-                                          f"Language: {lang_code}, Status: {data['status']}")
-                            
-                            # Wait for processing to complete
-                            time.sleep(3)
-                            if self.verify_multilingual_processing_completion(mode_type, mode_name, lang_code, lang_name):
-                                success_count += 1
-                        else:
-                            self.log_result(f"AI {mode_name} ({lang_name})", False, 
-                                          f"Unexpected response: {data}")
-                    else:
-                        self.log_result(f"AI {mode_name} ({lang_name})", False, 
+                    response = self.session.post(
+                        f"{API_BASE}/recordings/{self.test_recording_id}/process",
+                        headers=self._json_headers,
+                        json=processing_data,
+                        timeout=15
+                    )
+                    if response.status_code != 200:
+                        self.log_result(f"AI {mode_name} ({lang_name})", False,
                                       f"HTTP {response.status_code}: {response.text}")
+                        continue
+                    data = self._json(response)
+                    if data.get('status') != 'processing' or lang_code not in data.get('message', ''):
+                        self.log_result(f"AI {mode_name} ({lang_name})", False,
+                                      f"Unexpected response: {data}")
+                        continue
+                    self.log_result(f"AI {mode_name} ({lang_name})", True,
+                                  f"{mode_name} processing started in {lang_name}",
+                                  f"Language: {lang_code}, Status: {data['status']}")
+                    time.sleep(3)  # mock processing completes well within this
+                    success_count += int(self.verify_multilingual_processing_completion(
+                        mode_type, mode_name, lang_code, lang_name))
                 except Exception as e:
-                    self.log_result(f"AI {mode_name} ({lang_name})", False, 
+                    self.log_result(f"AI {mode_name} ({lang_name})", False,
                                   f"Request error: {str(e)}")
-        
-        self.results['multilingual_ai']['passed'] = success_count
-        
-        # Overall result
-        if success_count >= 12:  # Allow some tolerance for async processing
-            self.log_result("Multilingual AI Processing", True, 
-                          f"{success_count}/{total_tests} multilingual AI processing tests successful")
-            return True
-        else:
-            self.log_result("Multilingual AI Processing", False, 
-                          f"Only {success_count}/{total_tests} multilingual processing tests successful")
-            return False
+        return success_count
 
     def verify_multilingual_processing_completion(self, mode_type, mode_name, lang_code, lang_name):
         """Verify that multilingual AI processing was completed correctly"""
         try:
-            headers = {'Authorization': f'Bearer {self.session_token}'}
-            response = requests.get(f"{API_BASE}/recordings/{self.test_recording_id}", 
-                                  headers=headers, timeout=10)
-            
+            response = self.session.get(f"{API_BASE}/recordings/{self.test_recording_id}",
+                                  timeout=10)
+            return self._check_processing_response(response, mode_type, mode_name, lang_code, lang_name)
+        except Exception as e:
+            self.log_result(f"AI {mode_name} ({lang_name}) Completion", False,
+                          f"Request error: {str(e)}")
+            return False
+
+    def _check_processing_response(self, response, mode_type, mode_name, lang_code, lang_name, data=None):
+        """Judge a fetched recording response; shared by the sync and async paths"""
+        try:
             if response.status_code == 200:
-                data = response.json()
+                if data is None:
+                    data = self._json(response)
                 if data.get('status') == 'completed':
-                    # Language-specific validation keywords
-                    language_keywords = {
-                        "en": ["Newton's Laws", "Physics", "motion", "force"],
-                        "it": ["Leggi di Newton", "Fisica", "movimento", "forza", "moto"],
-                        "es": ["Leyes de Newton", "Física", "movimiento", "fuerza"],
-                        "fr": ["Lois de Newton", "Physique", "mouvement", "force"],
-                        "de": ["Newtons Gesetze", "Physik", "Bewegung", "Kraft"]
-                    }
-                    
-                    keywords = language_keywords.get(lang_code, language_keywords["en"])
-                    
+                    # Fast negative: if no keyword appears anywhere in the raw
+                    # bytes, the per-field checks below cannot pass either
+                    raw = response.content
+                    keywords = LANGUAGE_KEYWORDS_BYTES.get(lang_code, LANGUAGE_KEYWORDS_BYTES["en"])
+                    if all(raw.find(kw) == -1 for kw in keywords):
+                        self.log_result(f"AI {mode_name} ({lang_name}) Completion", False,
+                                      f"Content doesn't contain expected {lang_name} keywords")
+                        return False
+
+                    pattern = LANG_PATTERNS.get(lang_code, LANG_PATTERNS["en"])
+
                     # Check for appropriate content based on mode
                     if mode_type == 'full' and data.get('transcript'):
                         content = data['transcript']
-                        if any(keyword in content for keyword in keywords) and len(content) > 500:
+                        if pattern.search(content) and len(content) > 500:
                             self.log_result(f"AI {mode_name} ({lang_name}) Completion", True, 
                                           f"{mode_name} completed with {lang_name} content",
                                           f"Content length: {len(content)} chars, Language: {lang_code}")
                             return True
                     elif mode_type in ['summary', 'chapters'] and data.get('summary'):
                         content = data['summary']
-                        if any(keyword in content for keyword in keywords) and len(content) > 200:
+                        if pattern.search(content) and len(content) > 200:
                             self.log_result(f"AI {mode_name} ({lang_name}) Completion", True, 
                                           f"{mode_name} completed with {lang_name} content",
                                           f"Content length: {len(content)} chars, Language: {lang_code}")
@@ -352,13 +558,13 @@ class MultilingualTester:
                               f"HTTP {response.status_code}: {response.text}")
                 return False
         except Exception as e:
-            self.log_result(f"AI {mode_name} ({lang_name}) Completion", False, 
-                          f"Request error: {str(e)}")
+            self.log_result(f"AI {mode_name} ({lang_name}) Completion", False,
+                          f"Response error: {str(e)}")
             return False
 
     def test_recording_management(self):
         """Test 6: Recording Management - Test CRUD operations"""
-        print("\n=== 6. RECORDING MANAGEMENT ===")
+        self._log_buf.write("\n=== 6. RECORDING MANAGEMENT ===\n")
         if not self.session_token or not self.test_recording_id:
             self.log_result("Recording Management", False, "No session token or recording ID available")
             return False
@@ -368,12 +574,11 @@ class MultilingualTester:
         
         # Test GET specific recording
         try:
-            headers = {'Authorization': f'Bearer {self.session_token}'}
-            response = requests.get(f"{API_BASE}/recordings/{self.test_recording_id}", 
-                                  headers=headers, timeout=10)
+            response = self.session.get(f"{API_BASE}/recordings/{self.test_recording_id}", 
+                                  timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = self._json(response)
                 if data.get('id') == self.test_recording_id:
                     self.log_result("Recording GET", True, "Retrieved specific recording successfully")
                     success_count += 1
@@ -386,24 +591,19 @@ class MultilingualTester:
         
         # Test PUT (update recording)
         try:
-            headers = {
-                'Authorization': f'Bearer {self.session_token}',
-                'Content-Type': 'application/json'
-            }
-            
             update_data = {
                 'title': 'Updated Multilingual Test Physics Lecture',
                 'tags': ['physics', 'multilingual', 'updated'],
                 'notes': 'Updated notes for multilingual testing'
             }
             
-            response = requests.put(f"{API_BASE}/recordings/{self.test_recording_id}",
-                                  headers=headers,
+            response = self.session.put(f"{API_BASE}/recordings/{self.test_recording_id}",
+                                  headers=self._json_headers,
                                   json=update_data,
                                   timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = self._json(response)
                 if 'message' in data and 'updated' in data['message'].lower():
                     self.log_result("Recording PUT", True, "Recording updated successfully")
                     success_count += 1
@@ -414,31 +614,15 @@ class MultilingualTester:
         except Exception as e:
             self.log_result("Recording PUT", False, f"Request error: {str(e)}")
         
-        # Test DELETE recording (we'll skip this to preserve the recording for other tests)
+        # Test DELETE recording against the disposable recording created in
+        # the storage test; the main recording stays intact for other tests
         try:
-            headers = {'Authorization': f'Bearer {self.session_token}'}
-            # Create a new recording just for deletion test
-            recording_data = {
-                'title': 'Test Recording for Deletion',
-                'audio_data': TEST_AUDIO_DATA,
-                'tags': ['test', 'delete'],
-                'notes': 'This recording will be deleted',
-                'duration': 60.0
-            }
-            
-            create_response = requests.post(f"{API_BASE}/recordings", 
-                                          headers={'Authorization': f'Bearer {self.session_token}', 'Content-Type': 'application/json'}, 
-                                          json=recording_data, 
-                                          timeout=15)
-            
-            if create_response.status_code == 200:
-                delete_recording_id = create_response.json()['id']
-                
-                response = requests.delete(f"{API_BASE}/recordings/{delete_recording_id}",
-                                         headers=headers, timeout=10)
+            if self._delete_target_id:
+                response = self.session.delete(f"{API_BASE}/recordings/{self._delete_target_id}",
+                                         timeout=10)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = self._json(response)
                     if 'message' in data and 'deleted' in data['message'].lower():
                         self.log_result("Recording DELETE", True, "Recording deleted successfully")
                         success_count += 1
@@ -447,11 +631,11 @@ class MultilingualTester:
                 else:
                     self.log_result("Recording DELETE", False, f"HTTP {response.status_code}: {response.text}")
             else:
-                self.log_result("Recording DELETE", False, "Failed to create test recording for deletion")
+                self.log_result("Recording DELETE", False, "No disposable recording available from storage test")
         except Exception as e:
             self.log_result("Recording DELETE", False, f"Request error: {str(e)}")
         
-        self.results['recording_management']['passed'] = success_count
+        self.results.recording_management['passed'] = success_count
         
         # Overall result
         if success_count == total_tests:
@@ -463,7 +647,7 @@ class MultilingualTester:
 
     def test_user_profile(self):
         """Test 7: User Profile - Test profile with language preferences"""
-        print("\n=== 7. USER PROFILE ===")
+        self._log_buf.write("\n=== 7. USER PROFILE ===\n")
         if not self.session_token:
             self.log_result("User Profile", False, "No session token available")
             return False
@@ -473,20 +657,18 @@ class MultilingualTester:
         
         # Test GET user profile
         try:
-            headers = {'Authorization': f'Bearer {self.session_token}'}
-            response = requests.get(f"{API_BASE}/user/profile", headers=headers, timeout=10)
+            response = self.session.get(f"{API_BASE}/user/profile", timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                required_fields = ['id', 'email', 'name', 'subscription_status', 'referral_code', 'preferred_language']
-                
-                if all(field in data for field in required_fields):
+                data = self._json(response)
+                missing = _PROFILE_FIELDS - data.keys()
+
+                if not missing:
                     self.log_result("User Profile GET", True, "User profile retrieved successfully",
                                   f"User: {data['name']}, Language: {data['preferred_language']}, Status: {data['subscription_status']}")
                     success_count += 1
                 else:
-                    missing = [f for f in required_fields if f not in data]
-                    self.log_result("User Profile GET", False, f"Missing fields: {missing}")
+                    self.log_result("User Profile GET", False, f"Missing fields: {sorted(missing)}")
             else:
                 self.log_result("User Profile GET", False, f"HTTP {response.status_code}: {response.text}")
         except Exception as e:
@@ -494,20 +676,18 @@ class MultilingualTester:
         
         # Test GET referral info
         try:
-            headers = {'Authorization': f'Bearer {self.session_token}'}
-            response = requests.get(f"{API_BASE}/user/referral", headers=headers, timeout=10)
+            response = self.session.get(f"{API_BASE}/user/referral", timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                required_fields = ['referral_code', 'discount_amount', 'monthly_cost']
-                
-                if all(field in data for field in required_fields):
+                data = self._json(response)
+                missing = _REFERRAL_FIELDS - data.keys()
+
+                if not missing:
                     self.log_result("User Referral GET", True, "Referral info retrieved successfully",
                                   f"Code: {data['referral_code']}, Cost: €{data['monthly_cost']}")
                     success_count += 1
                 else:
-                    missing = [f for f in required_fields if f not in data]
-                    self.log_result("User Referral GET", False, f"Missing fields: {missing}")
+                    self.log_result("User Referral GET", False, f"Missing fields: {sorted(missing)}")
             else:
                 self.log_result("User Referral GET", False, f"HTTP {response.status_code}: {response.text}")
         except Exception as e:
@@ -516,20 +696,28 @@ class MultilingualTester:
         # Overall result
         if success_count == total_tests:
             self.log_result("User Profile and Referral System", True, f"All {total_tests} profile operations successful")
-            self.results['user_profile'] = True
+            self.results.user_profile = True
             return True
         else:
             self.log_result("User Profile and Referral System", False, f"Only {success_count}/{total_tests} operations successful")
             return False
     
-    def run_comprehensive_multilingual_tests(self):
-        """Run comprehensive multilingual backend testing"""
-        print("=" * 80)
-        print("SMARTNOTES COMPREHENSIVE MULTILINGUAL BACKEND TESTING")
-        print("=" * 80)
-        print(f"Testing API at: {API_BASE}")
-        print(f"Session ID: {TEST_SESSION_ID}")
-        print("=" * 80)
+    def run_comprehensive_multilingual_tests(self, output_format='text'):
+        """Run comprehensive multilingual backend testing.
+
+        output_format 'text' prints the full human-readable report; 'json'
+        emits a single machine-readable line for CI consumers instead.
+        """
+        text_output = output_format == 'text'
+        if not text_output:
+            self._live_stream = sys.stderr
+        if text_output:
+            print("=" * 80)
+            print("SMARTNOTES COMPREHENSIVE MULTILINGUAL BACKEND TESTING")
+            print("=" * 80)
+            print(f"Testing API at: {API_BASE}")
+            print(f"Session ID: {TEST_SESSION_ID}")
+            print("=" * 80)
         
         # Test sequence
         tests = [
@@ -555,6 +743,37 @@ class MultilingualTester:
                 self.log_result(test_name, False, f"Test execution error: {str(e)}")
                 failed += 1
         
+        # One row per category; adding a test means adding a row here rather
+        # than editing the averaging math below
+        rate_rows = [
+            ("Health Check", 100.0 if self.results.health_check else 0.0),
+            ("User Authentication", 100.0 if self.results.user_auth else 0.0),
+            ("User Language Preferences (5 languages)",
+             self.results.language_preferences['passed'] / self.results.language_preferences['total'] * 100),
+            ("Audio Recording Storage", 100.0 if self.results.audio_storage else 0.0),
+            ("Multilingual AI Processing (15 combinations)",
+             self.results.multilingual_ai['passed'] / self.results.multilingual_ai['total'] * 100),
+            ("Recording Management CRUD",
+             self.results.recording_management['passed'] / self.results.recording_management['total'] * 100),
+            ("User Profile", 100.0 if self.results.user_profile else 0.0)
+        ]
+        rates = np.array([rate for _, rate in rate_rows], dtype=np.float32)
+        overall_rate = float(rates.mean())
+
+        if not text_output:
+            sys.stdout.buffer.write(orjson.dumps({
+                'rates': dict(rate_rows),
+                'passed': passed,
+                'failed': failed,
+                'skipped': self.results.multilingual_ai.get('skipped', 0),
+                'overall': overall_rate
+            }) + b"\n")
+            return passed, failed, overall_rate
+
+        # Flush the buffered per-test output in one write, then summarize
+        sys.stdout.write(self._log_buf.getvalue())
+        sys.stdout.flush()
+
         # Final comprehensive summary
         print("\n" + "=" * 80)
         print("COMPREHENSIVE MULTILINGUAL TESTING RESULTS")
@@ -562,13 +781,13 @@ class MultilingualTester:
         
         # Feature category results
         categories = [
-            ("Health Check", self.results['health_check']),
-            ("User Authentication", self.results['user_auth']),
-            ("User Language Preferences", f"{self.results['language_preferences']['passed']}/5"),
-            ("Audio Recording Storage", self.results['audio_storage']),
-            ("Multilingual AI Processing", f"{self.results['multilingual_ai']['passed']}/15"),
-            ("Recording Management", f"{self.results['recording_management']['passed']}/3"),
-            ("User Profile", self.results['user_profile'])
+            ("Health Check", self.results.health_check),
+            ("User Authentication", self.results.user_auth),
+            ("User Language Preferences", f"{self.results.language_preferences['passed']}/5"),
+            ("Audio Recording Storage", self.results.audio_storage),
+            ("Multilingual AI Processing", f"{self.results.multilingual_ai['passed']}/15"),
+            ("Recording Management", f"{self.results.recording_management['passed']}/3"),
+            ("User Profile", self.results.user_profile)
         ]
         
         for category, result in categories:
@@ -581,34 +800,42 @@ class MultilingualTester:
         print("\n" + "=" * 80)
         print("DETAILED SUCCESS RATES BY CATEGORY:")
         print("=" * 80)
-        
-        # Calculate success rates
-        health_rate = 100 if self.results['health_check'] else 0
-        auth_rate = 100 if self.results['user_auth'] else 0
-        lang_rate = (self.results['language_preferences']['passed'] / 5) * 100
-        storage_rate = 100 if self.results['audio_storage'] else 0
-        ai_rate = (self.results['multilingual_ai']['passed'] / 15) * 100
-        crud_rate = (self.results['recording_management']['passed'] / 3) * 100
-        profile_rate = 100 if self.results['user_profile'] else 0
-        
-        print(f"1. Health Check: {health_rate:.1f}%")
-        print(f"2. User Authentication: {auth_rate:.1f}%")
-        print(f"3. User Language Preferences (5 languages): {lang_rate:.1f}%")
-        print(f"4. Audio Recording Storage: {storage_rate:.1f}%")
-        print(f"5. Multilingual AI Processing (15 combinations): {ai_rate:.1f}%")
-        print(f"6. Recording Management CRUD: {crud_rate:.1f}%")
-        print(f"7. User Profile: {profile_rate:.1f}%")
-        
-        overall_rate = (health_rate + auth_rate + lang_rate + storage_rate + ai_rate + crud_rate + profile_rate) / 7
-        
+
+        for position, (label, rate) in enumerate(rate_rows, 1):
+            print(f"{position}. {label}: {rate:.1f}%")
+
         print(f"\nOVERALL SUCCESS RATE: {overall_rate:.1f}%")
         print("=" * 80)
         
         return passed, failed, overall_rate
 
 if __name__ == "__main__":
-    tester = MultilingualTester()
-    passed, failed, success_rate = tester.run_comprehensive_multilingual_tests()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SmartNotes multilingual backend test suite")
+    parser.add_argument('--format', choices=('text', 'json'), default='text',
+                        help="text prints the full report, json emits one machine-readable line")
+    parser.add_argument('--profile', action='store_true',
+                        help="profile the run with cProfile and dump multilingual_test.prof")
+    parser.add_argument('--serial', action='store_true',
+                        help="run the AI combinations one at a time instead of concurrently")
+    args = parser.parse_args()
+
+    _init_env()
+
+    tester = MultilingualTester(serial=args.serial)
+    if args.profile:
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        passed, failed, success_rate = tester.run_comprehensive_multilingual_tests(output_format=args.format)
+        profiler.disable()
+        profiler.dump_stats('multilingual_test.prof')
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+    else:
+        passed, failed, success_rate = tester.run_comprehensive_multilingual_tests(output_format=args.format)
     
     # Exit with appropriate code
     exit(0 if failed == 0 else 1)
\ No newline at end of file